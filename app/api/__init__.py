@@ -6,6 +6,7 @@ from .user_api import router as user_router
 from .postlogin_api import router as postlogin_router
 from .mock_api import router as mock_router
 
+# All Depends() must be async: sync dependencies are run in the threadpool on every request.
 api_router = APIRouter()
 api_router.include_router(auth_router)
 api_router.include_router(account_router)
@@ -2,6 +2,7 @@ import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Body, Header, status, Request
+from fastapi.responses import ORJSONResponse
 
 from app.schema.postlogin_dto import (
     InitPostloginSessionRequest,
@@ -12,7 +13,7 @@ from app.service.postlogin_service import postlogin_service
 
 _log = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/postlogin", tags=["postlogin"])
+router = APIRouter(prefix="/postlogin", tags=["postlogin"], default_response_class=ORJSONResponse)
 
 
 @router.post(
@@ -51,7 +52,7 @@ async def init_postlogin_user_session(
         }
     )],
     x_request_id: str = Header(default="", alias="x-request-id")
-) -> TokenResponse:
+) -> ORJSONResponse:
     """
     Initialize postlogin user session
     
@@ -73,15 +74,16 @@ async def init_postlogin_user_session(
         cif=data.cif,
         basic_customer_info=data.basic_customer_info,
         token_key=data.token_key,
-        payload=data.payload.dict(),
+        payload=data.payload.model_dump(by_alias=True),
         request_id_header=x_request_id
     )
     
-    return TokenResponse(
-        token=result["token"],
-        refresh_token=result["refreshToken"],
-        message=result["message"]
-    )
+    # Returned as a response directly: response_model is only used for the OpenAPI schema
+    return ORJSONResponse({
+        "token": result["token"],
+        "refreshToken": result["refreshToken"],
+        "message": result["message"]
+    })
 
 
 @router.post(
@@ -109,7 +111,7 @@ async def renew_postlogin_user_token(
             }
         }
     )]
-) -> TokenResponse:
+) -> ORJSONResponse:
     """
     Renew postlogin user token
     
@@ -129,11 +131,11 @@ async def renew_postlogin_user_token(
         refresh_token=data.refresh_token
     )
     
-    return TokenResponse(
-        token=result["token"],
-        refresh_token=result["refreshToken"],
-        message=result["message"]
-    )
+    return ORJSONResponse({
+        "token": result["token"],
+        "refreshToken": result["refreshToken"],
+        "message": result["message"]
+    })
 
 
 @router.get(
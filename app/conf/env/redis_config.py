@@ -10,7 +10,13 @@ class RedisSettings(BaseSettings):
     REDIS_PASSWORD: str = Field(default="", description="Redis password")
     REDIS_DB: int = Field(default=0, description="Redis database number")
     REDIS_URL: str = Field(default="", description="Redis URL (overrides other settings if provided)")
+    REDIS_MAX_CONNECTIONS: int = Field(default=64, description="Max connections in the shared Redis pool")
+    REDIS_HEALTH_CHECK_INTERVAL: int = Field(default=30, description="Seconds between health checks on idle connections")
+    REDIS_WRITE_BATCH_WINDOW_MS: float = Field(default=2, description="Milliseconds to collect session writes before flushing them in one pipeline")
+    REDIS_WRITE_BATCH_TIMEOUT: float = Field(default=5, description="Seconds to wait for a batched session write before giving up")
+    REDIS_WRITE_BATCH_MAX_SIZE: int = Field(default=512, description="Max number of session writes flushed in one pipeline")
     SME_SESSION_TTL: int = Field(default=3600, description="Session TTL in seconds")
+    SME_VERIFY_CACHE_TTL: int = Field(default=30, description="TTL in seconds for cached SME token verification results")
     
     class Config:
         env_file = ".env"
@@ -20,6 +20,24 @@ class ServerSettings(BaseSettings):
         Number of worker processes to spawn
     CONTEXT_PATH: str
         Base path for the API endpoints in the server like /api/v1 or /pyfapi/api/v2 etc.
+    LOOP: str
+        Event loop implementation for uvicorn like uvloop, asyncio or auto
+    HTTP: str
+        HTTP protocol parser for uvicorn like httptools, h11 or auto
+    ACCESS_LOG: bool
+        Enable uvicorn access log, one log record per request
+    PROXY_HEADERS: bool
+        Enable X-Forwarded-Proto / X-Forwarded-For handling, only behind a trusted proxy
+    FORWARDED_ALLOW_IPS: str
+        Comma separated list of trusted proxy IPs when PROXY_HEADERS is enabled
+    GZIP_ENABLED: bool
+        Enable gzip response compression, disable it when a proxy in front already compresses
+    GZIP_MINIMUM_SIZE: int
+        Responses smaller than this size in bytes are not compressed
+    GZIP_COMPRESS_LEVEL: int
+        Gzip compression level from 1 (fastest) to 9 (smallest)
+    PROFILING_ENABLED: bool
+        Enable pyinstrument profiling of requests called with ?profile=1, never enable in production
     """
 
     HOST: str = "0.0.0.0"
@@ -28,6 +46,15 @@ class ServerSettings(BaseSettings):
     RELOAD: bool = True
     WORKERS: int = 1
     CONTEXT_PATH: str = "/api/v1"
+    LOOP: str = "uvloop"
+    HTTP: str = "httptools"
+    ACCESS_LOG: bool = False
+    PROXY_HEADERS: bool = False
+    FORWARDED_ALLOW_IPS: str = "127.0.0.1"
+    GZIP_ENABLED: bool = True
+    GZIP_MINIMUM_SIZE: int = 1024
+    GZIP_COMPRESS_LEVEL: int = 5
+    PROFILING_ENABLED: bool = False
 
     class Config:
         env_prefix = "SERVER_"
@@ -1,9 +1,11 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 import markdown
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.templating import Jinja2Templates
 
@@ -14,6 +16,7 @@ from app.errors.business_exception import BusinessException
 from app.middleware.security_middleware import SecurityMiddleware
 from app.migration import user_migration
 from app.service.redis_service import redis_service
+from app.service.token_verification_service import token_verification_service
 
 print("app.main.py is running")
 
@@ -24,10 +27,13 @@ _templates = Jinja2Templates(directory="././templates")
 @asynccontextmanager
 async def lifespan(_):
     _log.debug("FastAPI Lifespan started")
+    _log.info(f"Event loop: {type(asyncio.get_running_loop()).__module__}")
     await init_db()
     await user_migration.init_migration()
     await redis_service.connect()
+    await token_verification_service.connect()
     yield
+    await token_verification_service.disconnect()
     await redis_service.disconnect()
 
 
@@ -86,6 +92,14 @@ app = FastAPI(
     servers=servers_metadata
 )
 
+if server_settings.GZIP_ENABLED:
+    # noinspection PyTypeChecker
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=server_settings.GZIP_MINIMUM_SIZE,
+        compresslevel=server_settings.GZIP_COMPRESS_LEVEL
+    )
+
 # noinspection PyTypeChecker
 app.add_middleware(
     CORSMiddleware,
@@ -95,6 +109,13 @@ app.add_middleware(
     allow_headers=cors_settings.ALLOWED_HEADERS
 )
 
+if server_settings.PROFILING_ENABLED:
+    # imported lazily so pyinstrument is only needed when profiling
+    from app.middleware.profiler_middleware import ProfilerMiddleware
+
+    # noinspection PyTypeChecker
+    app.add_middleware(ProfilerMiddleware)
+
 # noinspection PyTypeChecker
 app.add_middleware(SecurityMiddleware)
 app.include_router(api_router)
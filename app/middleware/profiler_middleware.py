@@ -0,0 +1,23 @@
+from fastapi import Request
+from pyinstrument import Profiler
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import HTMLResponse
+
+PROFILE_QUERY_PARAM = "profile"
+
+
+class ProfilerMiddleware(BaseHTTPMiddleware):
+    """Profile a single request with pyinstrument when it is called with ?profile=1."""
+
+    async def dispatch(self, request: Request, call_next):
+        if request.query_params.get(PROFILE_QUERY_PARAM) != "1":
+            return await call_next(request)
+
+        profiler = Profiler(async_mode="enabled", interval=0.001)
+        profiler.start()
+        try:
+            await call_next(request)
+        finally:
+            profiler.stop()
+
+        return HTMLResponse(profiler.output_html())
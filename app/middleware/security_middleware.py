@@ -1,3 +1,5 @@
+import re
+
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
@@ -10,6 +12,17 @@ API_PREFIX = server_settings.CONTEXT_PATH
 ALLOWED_PATHS = [resource for resource in security_settings.ALLOWED_PATHS]
 
 
+def _compile_allowed_paths(paths: list[str]) -> re.Pattern:
+    """Compile allowed paths into one regex, a trailing "*" allows every path with that prefix,
+    any other entry must match exactly. An empty list matches nothing."""
+    return re.compile("|".join(
+        re.escape(p[:-1]) + ".*" if p.endswith("*") else re.escape(p) for p in paths
+    ) or "(?!)", re.DOTALL)
+
+
+_ALLOWED_PATHS_RE = _compile_allowed_paths(ALLOWED_PATHS)
+
+
 class SecurityMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
         if self._is_allowed_path(request.url.path):
@@ -26,12 +39,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
     @staticmethod
     def _is_allowed_path(path: str) -> bool:
         """Check if the path is in the list of allowed paths without authorization."""
-        for allowed_path in ALLOWED_PATHS:
-            if allowed_path.endswith("*") and path.startswith(allowed_path[:-1]):
-                return True
-            if path == allowed_path:
-                return True
-        return False
+        return _ALLOWED_PATHS_RE.fullmatch(path) is not None
 
     @staticmethod
     def _is_valid_token(token: str) -> bool:
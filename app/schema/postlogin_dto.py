@@ -1,6 +1,9 @@
 from datetime import datetime
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import Annotated, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+
+# Stripped and checked for emptiness by pydantic-core, no Python validator needed
+NonBlankStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
 
 
 class BasicCustomerInfo(BaseModel):
@@ -13,8 +16,10 @@ class BasicCustomerInfo(BaseModel):
 
 class PostloginPayload(BaseModel):
     """Payload data for postlogin session"""
-    channel_id: str = Field(..., description="Channel ID")
+    channel_id: str = Field(..., alias="channelId", description="Channel ID")
     # Add other payload fields as needed
+    
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class InitPostloginSessionRequest(BaseModel):
@@ -24,22 +29,12 @@ class InitPostloginSessionRequest(BaseModel):
 
 class InitPostloginSessionData(BaseModel):
     """Data model for initializing postlogin session"""
-    cif: str = Field(..., min_length=1, description="Customer Identification Number")
-    basic_customer_info: BasicCustomerInfo = Field(..., description="Basic customer information")
-    token_key: str = Field(..., min_length=1, description="Token key for validation")
+    cif: NonBlankStr = Field(..., description="Customer Identification Number")
+    basic_customer_info: BasicCustomerInfo = Field(..., alias="basicCustomerInfo", description="Basic customer information")
+    token_key: NonBlankStr = Field(..., alias="tokenKey", description="Token key for validation")
     payload: PostloginPayload = Field(..., description="Additional payload data")
     
-    @validator('cif')
-    def validate_cif(cls, v):
-        if not v or not v.strip():
-            raise ValueError('CIF cannot be empty')
-        return v.strip()
-    
-    @validator('token_key')
-    def validate_token_key(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Token key cannot be empty')
-        return v.strip()
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class RenewTokenRequest(BaseModel):
@@ -49,7 +44,9 @@ class RenewTokenRequest(BaseModel):
 
 class RenewTokenData(BaseModel):
     """Data model for renewing token"""
-    refresh_token: str = Field(..., min_length=1, description="Refresh token")
+    refresh_token: str = Field(..., min_length=1, alias="refreshToken", description="Refresh token")
+    
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class SessionData(BaseModel):
@@ -68,8 +65,10 @@ class SessionData(BaseModel):
 class TokenResponse(BaseModel):
     """Response model for token operations"""
     token: str
-    refresh_token: str
+    refresh_token: str = Field(..., alias="refreshToken")
     message: str
+    
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class ChannelSetting(BaseModel):
@@ -77,8 +76,7 @@ class ChannelSetting(BaseModel):
     id: str
     post_login_bu: Optional[str] = Field(None, alias="postLoginBu")
     
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 # Update forward references
@@ -41,9 +41,10 @@ def is_valid_token(token: str) -> bool:
         return False
 
 
-def get_token_user(token: str = Depends(oauth2_scheme)) -> Dict:
+async def get_token_user(token: str = Depends(oauth2_scheme)) -> Dict:
     """
     Get the current user from the access token
+    Declared async so FastAPI awaits it inline instead of running it in the threadpool
     :param token: authentication token
     :return: user and token data
     """
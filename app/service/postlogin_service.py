@@ -1,8 +1,13 @@
-import json
+import asyncio
+import hashlib
 import logging
-import time
-from typing import Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field
+from time import time_ns
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 
+import orjson
+from cachetools import TTLCache
 from fastapi import HTTPException
 
 from app.schema.postlogin_dto import SessionData, BasicCustomerInfo
@@ -13,12 +18,33 @@ from app.conf.env.redis_config import redis_settings
 
 _log = logging.getLogger(__name__)
 
+_SESSION_KEY_PREFIX = b"session:"
+
+# Mock channel settings - in real app, this would be loaded from database
+_CHANNELS: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    "1": {"id": "1", "postLoginBu": "SME"},
+    "2": {"id": "2", "postLoginBu": "RETAIL"},
+    "sme": {"id": "sme", "postLoginBu": "SME"},
+    "retail": {"id": "retail", "postLoginBu": "RETAIL"}
+})
+
+
+@dataclass
+class _VerifyLock:
+    """Lock of an in-flight verification and the number of callers holding or waiting for it"""
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    waiters: int = 0
+
 
 class PostloginService:
     """Service for handling postlogin session management"""
     
     def __init__(self):
         self.session_ttl = redis_settings.SME_SESSION_TTL
+        # Successful external verifications, keyed by digest of bu|token_key|cif
+        self._verify_cache = TTLCache(maxsize=10_000, ttl=redis_settings.SME_VERIFY_CACHE_TTL)
+        # Locks of in-flight verifications, removed by the last caller using them
+        self._verify_locks: Dict[bytes, _VerifyLock] = {}
     
     async def init_postlogin_user_session(
         self,
@@ -47,7 +73,7 @@ class PostloginService:
             raise HTTPException(status_code=400, detail='Invalid channel id')
         
         # Mock channel setting - in real app, this would query database
-        channel_setting = await self._get_channel_setting(channel_id)
+        channel_setting = self._get_channel_setting(channel_id)
         if not channel_setting:
             raise HTTPException(status_code=404, detail=f'Cannot find channel with id {channel_id}')
         
@@ -65,7 +91,7 @@ class PostloginService:
         
         try:
             # Create session data
-            current_time = int(time.time() * 1000)  # milliseconds
+            current_time = time_ns() // 1_000_000  # milliseconds
             session_data = SessionData(
                 cif=cif,
                 chat_username=chat_username,
@@ -79,11 +105,12 @@ class PostloginService:
             )
             
             # Create tokens
-            token, refresh_token = await self._create_tokens(bu, session_data.dict())
+            token, refresh_token = await self._create_tokens(bu, chat_username, cif, token_key)
             
-            # Save session data to Redis
-            redis_key = f"session:{chat_username}"
-            await redis_service.set(redis_key, session_data.dict(), self.session_ttl)
+            # Save session data to Redis, serialized by pydantic-core straight to JSON
+            redis_key = _SESSION_KEY_PREFIX + chat_username.encode()
+            if not await redis_service.setex_batched(redis_key, self.session_ttl, session_data.model_dump_json()):
+                raise Exception(f'Failed to save session {redis_key.decode()}')
             
             return {
                 "token": token,
@@ -121,46 +148,47 @@ class PostloginService:
             raise HTTPException(status_code=400, detail='Invalid refresh token')
         
         # Get session data from Redis
-        redis_key = f"session:{chat_username}"
-        session_data_json = await redis_service.get(redis_key)
+        redis_key = _SESSION_KEY_PREFIX + chat_username.encode()
+        parsed_session_data = await redis_service.get_json(redis_key)
         
-        if not session_data_json:
+        if not parsed_session_data:
             raise HTTPException(status_code=404, detail='Session not found')
         
-        try:
-            parsed_session_data = json.loads(session_data_json)
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=500, detail='Invalid session data')
-        
-        token_key = parsed_session_data.get('tokenKey')
+        # SessionData is stored with its field names (snake_case)
+        token_key = parsed_session_data.get('token_key')
         cif = parsed_session_data.get('cif')
-        request_id_header = parsed_session_data.get('requestIdHeader', '')
+        request_id_header = parsed_session_data.get('request_id_header', '')
         
         if not token_key:
             raise HTTPException(status_code=400, detail='Invalid tokenKey')
         
         # Verify token with external service
         request_id_payload = request_id_header or ""
-        is_valid_token = await token_verification_service.verify_token(
+        is_valid_token = await self._verify_token_cached(
             bu, token_key, cif, request_id_payload
         )
         
         if not is_valid_token:
             raise HTTPException(status_code=401, detail=f'Verify {bu} token failed')
         
-        _log.info(f'redisKey: {redis_key}')
-        _log.info(f'sessionData: {session_data_json}')
-        _log.info(f'payloadRefreshToken: {payload_refresh_token}')
+        # Session data and refresh token payload carry customer data and tokens, do not log them
+        _log.debug("Renewing session redisKey=%s", redis_key)
         
         try:
             # Update session data
-            parsed_session_data['updated_at'] = int(time.time() * 1000)
+            parsed_session_data['updated_at'] = time_ns() // 1_000_000
             
             # Create new tokens
-            token, new_refresh_token = await self._create_tokens(bu, parsed_session_data)
+            token, new_refresh_token = await self._create_tokens(
+                bu,
+                parsed_session_data.get('chat_username'),
+                cif,
+                token_key
+            )
             
             # Update Redis
-            await redis_service.set(redis_key, parsed_session_data, self.session_ttl)
+            if not await redis_service.set(redis_key, orjson.dumps(parsed_session_data), self.session_ttl):
+                raise Exception(f'Failed to update session {redis_key.decode()}')
             
             return {
                 "token": token,
@@ -172,38 +200,78 @@ class PostloginService:
             _log.error(f"Error in renew_postlogin_user_token: {err}")
             raise HTTPException(status_code=500, detail='Internal Server Error')
     
-    async def _create_tokens(self, bu: str, session_data: Dict[str, Any]) -> Tuple[str, str]:
+    async def _verify_token_cached(self, bu: str, token_key: str, cif: str, request_id: str) -> bool:
+        """
+        Verify token with external service, reusing recent successful results
+        
+        Only valid results are cached so a transient verification failure is retried
+        on the next renew. Concurrent misses for the same key share one external call.
+        
+        Args:
+            bu: Business unit
+            token_key: Token to verify
+            cif: Customer identification number
+            request_id: Request ID forwarded to the external service
+            
+        Returns:
+            Boolean indicating if token is valid
+        """
+        key = hashlib.blake2b(f"{bu}|{token_key}|{cif}".encode(), digest_size=16).digest()
+        if key in self._verify_cache:
+            return True
+        
+        verify_lock = self._verify_locks.get(key)
+        if verify_lock is None:
+            verify_lock = self._verify_locks[key] = _VerifyLock()
+        verify_lock.waiters += 1
+        
+        try:
+            async with verify_lock.lock:
+                if key in self._verify_cache:
+                    return True
+                
+                is_valid = await token_verification_service.verify_token(bu, token_key, cif, request_id)
+                if is_valid:
+                    self._verify_cache[key] = True
+                return is_valid
+        finally:
+            verify_lock.waiters -= 1
+            if not verify_lock.waiters:
+                del self._verify_locks[key]
+    
+    async def _create_tokens(self, bu: str, chat_username: str, cif: str, token_key: str) -> Tuple[str, str]:
         """
         Create access token and refresh token
         
         Args:
             bu: Business unit
-            session_data: Session data dictionary
+            chat_username: Chat username of the session
+            cif: Customer identification number
+            token_key: Token key of the session
             
         Returns:
             Tuple of (access_token, refresh_token)
         """
         # Create token data
         token_data = {
-            "chatUsername": session_data.get("chat_username"),
+            "chatUsername": chat_username,
             "bu": bu,
-            "cif": session_data.get("cif"),
-            "tokenKey": session_data.get("token_key")
+            "cif": cif,
+            "tokenKey": token_key
         }
         
         # Create access token
         access_token = auth_handler.create_access_token(token_data)
         
-        # Create refresh token (using same logic for now, but could have different expiration)
-        refresh_token = auth_handler.create_access_token(token_data)
-        
-        return access_token, refresh_token
+        # Refresh token has the same claims and expiration for now, so reuse the signed token
+        # instead of signing the identical payload twice
+        return access_token, access_token
     
-    async def _get_channel_setting(self, channel_id: str) -> Optional[Dict[str, Any]]:
+    def _get_channel_setting(self, channel_id: str) -> Optional[Dict[str, Any]]:
         """
         Get channel setting by ID
         
-        In a real application, this would query the database.
+        In a real application, this would query the database (cache it, e.g. with alru_cache).
         For now, we'll return a mock setting.
         
         Args:
@@ -212,15 +280,7 @@ class PostloginService:
         Returns:
             Channel setting dictionary or None
         """
-        # Mock channel settings
-        mock_channels = {
-            "1": {"id": "1", "postLoginBu": "SME"},
-            "2": {"id": "2", "postLoginBu": "RETAIL"},
-            "sme": {"id": "sme", "postLoginBu": "SME"},
-            "retail": {"id": "retail", "postLoginBu": "RETAIL"}
-        }
-        
-        return mock_channels.get(channel_id)
+        return _CHANNELS.get(channel_id)
 
 
 # Global postlogin service instance
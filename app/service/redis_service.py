@@ -1,56 +1,93 @@
-import json
+import asyncio
 import logging
-from typing import Optional, Any
+from typing import Optional, Any, List, Tuple, Union
+from urllib.parse import quote
 
-import aioredis
-from aioredis import Redis
+import orjson
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.client import Pipeline
 
 from app.conf.env.redis_config import redis_settings
 
 _log = logging.getLogger(__name__)
 
+_RedisKey = Union[str, bytes]
+_PendingWrite = Tuple[_RedisKey, int, Any, asyncio.Future]
+
+
+def _build_redis_url() -> str:
+    """Build the Redis URL from settings, REDIS_URL takes precedence"""
+    if redis_settings.REDIS_URL:
+        return redis_settings.REDIS_URL
+
+    auth = f":{quote(redis_settings.REDIS_PASSWORD, safe='')}@" if redis_settings.REDIS_PASSWORD else ""
+    return f"redis://{auth}{redis_settings.REDIS_HOST}:{redis_settings.REDIS_PORT}/{redis_settings.REDIS_DB}"
+
+
+def _key_str(key: _RedisKey) -> str:
+    """Decode a key for logging so bytes keys are not printed as b'...'"""
+    return key.decode(errors="replace") if isinstance(key, bytes) else key
+
 
 class RedisService:
     """Redis service for session management"""
     
     def __init__(self):
+        self._pool: Optional[BlockingConnectionPool] = None
         self._redis: Optional[Redis] = None
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
     
     async def connect(self):
-        """Initialize Redis connection"""
+        """Initialize the Redis connection pool shared by the whole app"""
         try:
-            if redis_settings.REDIS_URL:
-                self._redis = await aioredis.from_url(redis_settings.REDIS_URL)
-            else:
-                self._redis = await aioredis.Redis(
-                    host=redis_settings.REDIS_HOST,
-                    port=redis_settings.REDIS_PORT,
-                    password=redis_settings.REDIS_PASSWORD if redis_settings.REDIS_PASSWORD else None,
-                    db=redis_settings.REDIS_DB,
-                    decode_responses=True
-                )
+            self._pool = BlockingConnectionPool.from_url(
+                _build_redis_url(),
+                max_connections=redis_settings.REDIS_MAX_CONNECTIONS,
+                health_check_interval=redis_settings.REDIS_HEALTH_CHECK_INTERVAL,
+                decode_responses=True
+            )
+            self._redis = Redis(connection_pool=self._pool)
             
             # Test connection
             await self._redis.ping()
+            
+            self._write_queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._batch_writer())
             _log.info("Redis connection established successfully")
         except Exception as e:
             _log.error(f"Failed to connect to Redis: {e}")
             raise
     
     async def disconnect(self):
-        """Close Redis connection"""
+        """Stop the write batcher and close Redis connection pool"""
+        if self._writer_task:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+            
+            # Fail writes that were queued but never flushed
+            pending: List[_PendingWrite] = []
+            while not self._write_queue.empty():
+                pending.append(self._write_queue.get_nowait())
+            self._fail_writes(pending)
+            self._write_queue = None
+        
         if self._redis:
-            await self._redis.close()
+            await self._redis.aclose()
+            await self._pool.disconnect()
+            self._redis = None
+            self._pool = None
             _log.info("Redis connection closed")
     
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    async def set(self, key: _RedisKey, value: Any, ttl: Optional[int] = None) -> bool:
         """Set a key-value pair in Redis with optional TTL"""
         try:
-            if not self._redis:
-                raise Exception("Redis not connected")
-            
             if isinstance(value, (dict, list)):
-                value = json.dumps(value)
+                value = orjson.dumps(value)
             
             if ttl:
                 await self._redis.setex(key, ttl, value)
@@ -59,44 +96,109 @@ class RedisService:
             
             return True
         except Exception as e:
-            _log.error(f"Failed to set Redis key {key}: {e}")
+            _log.error(f"Failed to set Redis key {_key_str(key)}: {e}")
+            return False
+    
+    async def setex_batched(self, key: _RedisKey, ttl: int, value: Any) -> bool:
+        """
+        Queue a SETEX that is flushed together with other pending writes in one pipeline
+        
+        Writes are collected for REDIS_WRITE_BATCH_WINDOW_MS after the first one arrives,
+        so a burst of session writes costs one round trip instead of one per write.
+        Returns False if the write is not confirmed within REDIS_WRITE_BATCH_TIMEOUT seconds.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._write_queue.put_nowait((key, ttl, value, future))
+        try:
+            return await asyncio.wait_for(future, redis_settings.REDIS_WRITE_BATCH_TIMEOUT)
+        except asyncio.TimeoutError:
+            _log.error(f"Timed out setting Redis key {_key_str(key)}")
             return False
     
-    async def get(self, key: str) -> Optional[str]:
+    async def _batch_writer(self):
+        """Flush queued SETEX commands in pipelined batches until cancelled"""
+        window = redis_settings.REDIS_WRITE_BATCH_WINDOW_MS / 1000
+        max_size = redis_settings.REDIS_WRITE_BATCH_MAX_SIZE
+        
+        while True:
+            batch: List[_PendingWrite] = []
+            try:
+                batch.append(await self._write_queue.get())
+                if window > 0:
+                    await asyncio.sleep(window)
+                while len(batch) < max_size and not self._write_queue.empty():
+                    batch.append(self._write_queue.get_nowait())
+                
+                await self._flush_writes(batch)
+            except asyncio.CancelledError:
+                # Writes already taken off the queue would otherwise never be resolved
+                self._fail_writes(batch)
+                raise
+    
+    @staticmethod
+    def _fail_writes(batch: List[_PendingWrite]):
+        """Resolve the futures of writes that will not be flushed"""
+        for key, _, _, future in batch:
+            if not future.done():
+                _log.error(f"Dropped Redis write for key {_key_str(key)}")
+                future.set_result(False)
+    
+    async def _flush_writes(self, batch: List[_PendingWrite]):
+        """Send a batch of SETEX commands in one pipeline and resolve their futures"""
+        try:
+            async with self.pipeline() as pipe:
+                for key, ttl, value, _ in batch:
+                    pipe.setex(key, ttl, value)
+                results = await pipe.execute(raise_on_error=False)
+        except Exception as e:
+            _log.error(f"Failed to flush {len(batch)} Redis writes: {e}")
+            results = [e] * len(batch)
+        
+        for (key, _, _, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                _log.error(f"Failed to set Redis key {_key_str(key)}: {result}")
+            if not future.done():
+                future.set_result(not isinstance(result, Exception))
+    
+    async def get(self, key: _RedisKey) -> Optional[str]:
         """Get value by key from Redis"""
         try:
-            if not self._redis:
-                raise Exception("Redis not connected")
-            
             return await self._redis.get(key)
         except Exception as e:
-            _log.error(f"Failed to get Redis key {key}: {e}")
+            _log.error(f"Failed to get Redis key {_key_str(key)}: {e}")
             return None
     
-    async def delete(self, key: str) -> bool:
+    async def get_json(self, key: _RedisKey) -> Optional[Any]:
+        """Get value by key from Redis and deserialize it from JSON"""
+        try:
+            value = await self._redis.get(key)
+            return orjson.loads(value) if value is not None else None
+        except Exception as e:
+            _log.error(f"Failed to get Redis JSON key {_key_str(key)}: {e}")
+            return None
+    
+    async def delete(self, key: _RedisKey) -> bool:
         """Delete a key from Redis"""
         try:
-            if not self._redis:
-                raise Exception("Redis not connected")
-            
             result = await self._redis.delete(key)
             return result > 0
         except Exception as e:
-            _log.error(f"Failed to delete Redis key {key}: {e}")
+            _log.error(f"Failed to delete Redis key {_key_str(key)}: {e}")
             return False
     
-    async def exists(self, key: str) -> bool:
+    async def exists(self, key: _RedisKey) -> bool:
         """Check if a key exists in Redis"""
         try:
-            if not self._redis:
-                raise Exception("Redis not connected")
-            
             result = await self._redis.exists(key)
             return result > 0
         except Exception as e:
-            _log.error(f"Failed to check Redis key {key}: {e}")
+            _log.error(f"Failed to check Redis key {_key_str(key)}: {e}")
             return False
     
+    def pipeline(self) -> Pipeline:
+        """Create a non-transactional pipeline to send several commands in one round trip"""
+        return self._redis.pipeline(transaction=False)
+    
     @property
     def is_connected(self) -> bool:
         """Check if Redis is connected"""
@@ -15,6 +15,32 @@ class TokenVerificationService:
     def __init__(self):
         self.sme_verify_base_url = os.getenv('SME_VERIFY_BASE_URL')
         self.sme_verify_token_key = os.getenv('SME_VERIFY_TOKEN_KEY')
+        self._verify_url = (
+            f"{self.sme_verify_base_url.rstrip('/')}/corporate/relationship-management/marketing/v1/customer/validate-session"
+            if self.sme_verify_base_url else None
+        )
+        # Static headers, copied and completed per call
+        self._base_headers = {
+            'Apikey': self.sme_verify_token_key,
+            'Content-Type': 'application/json',
+        }
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    async def connect(self):
+        """Create the HTTP client shared by all verification calls"""
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(5.0, connect=1.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+        _log.info("Token verification HTTP client created")
+    
+    async def disconnect(self):
+        """Close the shared HTTP client"""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+            _log.info("Token verification HTTP client closed")
     
     async def verify_sme_token(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -32,12 +58,16 @@ class TokenVerificationService:
         if not self.sme_verify_token_key:
             raise HTTPException(status_code=500, detail="SME_VERIFY_TOKEN_KEY is not defined")
         
-        url = f"{self.sme_verify_base_url.rstrip('/')}/corporate/relationship-management/marketing/v1/customer/validate-session"
+        if self._client is None:
+            # Otherwise the AttributeError below would be reported as an invalid token
+            _log.error("Token verification HTTP client is not created, call connect() first")
+            raise HTTPException(status_code=500, detail="Token verification client is not connected")
+        
+        url = self._verify_url
         
         headers = {
-            'Apikey': self.sme_verify_token_key,
-            'Content-Type': 'application/json',
-            'x-request-id': payload.get('requestId') or payload.get('userId') or str(uuid.uuid4()),
+            **self._base_headers,
+            'x-request-id': payload.get('requestId') or payload.get('userId') or uuid.uuid4().hex,
             'x-session-token': payload.get('tokenKey', ''),
             'x-user-id': payload.get('userId', ''),
         }
@@ -48,21 +78,20 @@ class TokenVerificationService:
         _log.info(f"x-user-id: {headers.get('x-user-id')}")
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json={}, headers=headers)
-                
-                if response.status_code != 200:
-                    _log.info(f'Error verify tokenKey: {response.status_code}')
-                    return {"isValid": False, "message": "Error verify tokenKey"}
-                
-                response_data = response.json()
-                _log.info(f'verify tokenKey: {response_data}')
-                
-                # Check if token is not expired
-                is_valid = not response_data.get('data', {}).get('isExpire', True)
-                
-                return {"isValid": is_valid, "message": None}
-                
+            response = await self._client.post(url, content=b"{}", headers=headers)
+            
+            if response.status_code != 200:
+                _log.info(f'Error verify tokenKey: {response.status_code}')
+                return {"isValid": False, "message": "Error verify tokenKey"}
+            
+            response_data = response.json()
+            _log.info(f'verify tokenKey: {response_data}')
+            
+            # Check if token is not expired
+            is_valid = not response_data.get('data', {}).get('isExpire', True)
+            
+            return {"isValid": is_valid, "message": None}
+            
         except Exception as error:
             _log.error(f'Error verify tokenKey: {error}')
             return {"isValid": False, "message": "Error verify tokenKey"}
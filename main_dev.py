@@ -7,7 +7,14 @@ if __name__ == "__main__":
     host = server_settings.HOST
     port = server_settings.PORT
     reload = server_settings.RELOAD
+    loop = server_settings.LOOP
+    http = server_settings.HTTP
+    access_log = server_settings.ACCESS_LOG
+    proxy_headers = server_settings.PROXY_HEADERS
+    forwarded_allow_ips = server_settings.FORWARDED_ALLOW_IPS
     env_file = ".env.dev"
 
-    uvicorn.run("app.main:app", host=host, port=port, reload=reload, env_file=env_file)
+    uvicorn.run("app.main:app", host=host, port=port, reload=reload, env_file=env_file,
+                loop=loop, http=http, access_log=access_log,
+                proxy_headers=proxy_headers, forwarded_allow_ips=forwarded_allow_ips)
     print("Running out")
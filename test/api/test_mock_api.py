@@ -0,0 +1,80 @@
+# python unittest for mock_api validate-session header validation
+import unittest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.mock_api import router
+
+VALIDATE_URL = "/corporate/relationship-management/marketing/v1/customer/validate-session"
+
+
+def _get_headers(**overrides):
+    headers = {
+        "Apikey": "test-api-key",
+        "x-request-id": "test-request-456",
+        "x-session-token": "valid_token_123",
+        "x-user-id": "1234567890",
+    }
+    headers.update(overrides)
+    return headers
+
+
+def _without(header: str):
+    headers = _get_headers()
+    del headers[header]
+    return headers
+
+
+class TestMockApiValidateSession(unittest.TestCase):
+    """
+    Test status codes of the mock validate-session endpoint
+    """
+
+    def setUp(self):
+        app = FastAPI()
+        app.include_router(router)
+        self.client = TestClient(app)
+
+    def test_given_all_headers_when_validate_session_then_ok(self):
+        response = self.client.post(VALIDATE_URL, headers=_get_headers())
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()["data"]["isExpire"])
+
+    def test_given_missing_apikey_when_validate_session_then_unauthorized(self):
+        response = self.client.post(VALIDATE_URL, headers=_without("Apikey"))
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()["detail"], "Missing Apikey header")
+
+    def test_given_empty_apikey_when_validate_session_then_unauthorized(self):
+        response = self.client.post(VALIDATE_URL, headers=_get_headers(Apikey=""))
+        self.assertEqual(response.status_code, 401)
+
+    def test_given_missing_request_id_when_validate_session_then_unprocessable(self):
+        response = self.client.post(VALIDATE_URL, headers=_without("x-request-id"))
+        self.assertEqual(response.status_code, 422)
+
+    def test_given_missing_session_token_when_validate_session_then_unprocessable(self):
+        response = self.client.post(VALIDATE_URL, headers=_without("x-session-token"))
+        self.assertEqual(response.status_code, 422)
+
+    def test_given_empty_session_token_when_validate_session_then_unprocessable(self):
+        response = self.client.post(VALIDATE_URL, headers=_get_headers(**{"x-session-token": ""}))
+        self.assertEqual(response.status_code, 422)
+
+    def test_given_missing_user_id_when_validate_session_then_unprocessable(self):
+        response = self.client.post(VALIDATE_URL, headers=_without("x-user-id"))
+        self.assertEqual(response.status_code, 422)
+
+    def test_given_empty_user_id_when_validate_session_then_unprocessable(self):
+        response = self.client.post(VALIDATE_URL, headers=_get_headers(**{"x-user-id": ""}))
+        self.assertEqual(response.status_code, 422)
+
+    def test_given_expired_token_when_validate_session_then_is_expired(self):
+        response = self.client.post(VALIDATE_URL, headers=_get_headers(**{"x-session-token": "expired_123"}))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["data"]["isExpire"])
+
+    def test_given_invalid_token_when_validate_session_then_unauthorized(self):
+        response = self.client.post(VALIDATE_URL, headers=_get_headers(**{"x-session-token": "invalid_123"}))
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,113 @@
+# python unittest for postlogin_api endpoints with fake redis and mocked token verification
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.api.postlogin_api import router
+from app.service.redis_service import RedisService
+from test.redis_helper import connect_fake_redis
+
+
+# region helpers
+
+def _get_init_body():
+    return {
+        "data": {
+            "cif": "1234567890",
+            "basicCustomerInfo": {
+                "customer_id": "CUST123",
+                "customer_name": "John Doe",
+                "customer_type": "SME"
+            },
+            "tokenKey": "valid_token_key_123",
+            "payload": {
+                "channelId": "sme"
+            }
+        }
+    }
+
+
+# endregion
+
+
+class TestPostloginApi(unittest.IsolatedAsyncioTestCase):
+    """
+    Test postlogin endpoints through the router with a fake redis backend
+    """
+
+    async def asyncSetUp(self):
+        self.redis_service = RedisService()
+        self.fake_redis = await connect_fake_redis(self.redis_service)
+        self.verify_token = AsyncMock(return_value=True)
+
+        self._patches = [
+            patch("app.service.postlogin_service.redis_service", self.redis_service),
+            patch("app.service.postlogin_service.token_verification_service.verify_token", self.verify_token),
+        ]
+        for p in self._patches:
+            p.start()
+
+        app = FastAPI()
+        app.include_router(router)
+        self.client = AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        for p in self._patches:
+            p.stop()
+        await self.redis_service.disconnect()
+
+    async def test_given_initialized_session_when_renew_then_return_new_tokens(self):
+        # given
+        init_response = await self.client.post(
+            "/postlogin/init-session", json=_get_init_body(), headers={"x-request-id": "test-request-123"}
+        )
+        self.assertEqual(init_response.status_code, 200, init_response.text)
+
+        # when
+        response = await self.client.post(
+            "/postlogin/renew-token", json={"data": {"refreshToken": init_response.json()["refreshToken"]}}
+        )
+
+        # then
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual(response.json()["message"], "SME token renewed successfully")
+        self.verify_token.assert_awaited_once_with("SME", "valid_token_key_123", "1234567890", "test-request-123")
+        session = await self.redis_service.get_json(b"session:VPB-SME-1234567890")
+        self.assertEqual(session["payload"], {"channelId": "sme"})
+
+    async def test_given_documented_body_when_init_session_then_return_camel_case_tokens(self):
+        # when
+        response = await self.client.post("/postlogin/init-session", json=_get_init_body())
+
+        # then
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual(set(response.json()), {"token", "refreshToken", "message"})
+
+    async def test_given_snake_case_body_when_init_and_renew_then_still_accepted(self):
+        # given
+        body = _get_init_body()
+        data = body["data"]
+        data["basic_customer_info"] = data.pop("basicCustomerInfo")
+        data["token_key"] = data.pop("tokenKey")
+        data["payload"] = {"channel_id": data["payload"]["channelId"]}
+
+        # when
+        init_response = await self.client.post("/postlogin/init-session", json=body)
+        renew_response = await self.client.post(
+            "/postlogin/renew-token", json={"data": {"refresh_token": init_response.json()["refreshToken"]}}
+        )
+
+        # then
+        self.assertEqual(init_response.status_code, 200, init_response.text)
+        self.assertEqual(renew_response.status_code, 200, renew_response.text)
+        self.assertEqual(set(renew_response.json()), {"token", "refreshToken", "message"})
+
+    async def test_given_empty_refresh_token_when_renew_then_unprocessable(self):
+        # when
+        response = await self.client.post("/postlogin/renew-token", json={"data": {"refreshToken": ""}})
+
+        # then
+        self.assertEqual(response.status_code, 422)
@@ -1,3 +1,8 @@
+import os
+
+# Log to console only in tests, the default "db" handler needs a running MongoDB at import time
+os.environ.setdefault("LOG_HANDLER", '["console"]')
+
 # import logging
 #
 # import pytest
@@ -0,0 +1,47 @@
+# python unittest for ProfilerMiddleware
+import unittest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.profiler_middleware import ProfilerMiddleware
+
+
+class TestProfilerMiddleware(unittest.TestCase):
+    """
+    Test ProfilerMiddleware only replaces the response when profiling is requested
+    """
+
+    def setUp(self):
+        app = FastAPI()
+        app.add_middleware(ProfilerMiddleware)
+
+        @app.get("/ping")
+        async def ping():
+            return {"status": "ok"}
+
+        self.client = TestClient(app)
+
+    def test_given_profile_param_when_request_then_return_html_report(self):
+        # when
+        response = self.client.get("/ping", params={"profile": "1"})
+
+        # then
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/html"))
+        self.assertIn("pyinstrument", response.text.lower())
+
+    def test_given_no_profile_param_when_request_then_pass_response_through(self):
+        # when
+        response = self.client.get("/ping")
+
+        # then
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"status": "ok"})
+
+    def test_given_other_profile_value_when_request_then_pass_response_through(self):
+        # when
+        response = self.client.get("/ping", params={"profile": "0"})
+
+        # then
+        self.assertEqual(response.json(), {"status": "ok"})
@@ -0,0 +1,51 @@
+# python unittest for security_middleware allowed path matching
+import unittest
+from unittest.mock import patch
+
+from app.middleware.security_middleware import SecurityMiddleware, _compile_allowed_paths
+
+ALLOWED_PATHS = ["/docs", "/", "/api/v1/auth/*", "/api/v1/postlogin/*", "/openapi.json"]
+
+
+def _is_allowed_path_loop(allowed_paths: list[str], path: str) -> bool:
+    """Reference implementation: the per-request loop the regex replaced"""
+    for allowed_path in allowed_paths:
+        if allowed_path.endswith("*") and path.startswith(allowed_path[:-1]):
+            return True
+        if path == allowed_path:
+            return True
+    return False
+
+
+class TestSecurityMiddlewareAllowedPaths(unittest.TestCase):
+    """
+    Test SecurityMiddleware._is_allowed_path against the previous loop implementation
+    """
+
+    def _assert_same_as_loop(self, allowed_paths: list[str], path: str, expected: bool):
+        with patch("app.middleware.security_middleware._ALLOWED_PATHS_RE", _compile_allowed_paths(allowed_paths)):
+            result = SecurityMiddleware._is_allowed_path(path)
+        self.assertEqual(result, _is_allowed_path_loop(allowed_paths, path))
+        self.assertEqual(result, expected)
+
+    def test_given_exact_entry_when_is_allowed_path_then_match_only_exact_path(self):
+        self._assert_same_as_loop(ALLOWED_PATHS, "/docs", True)
+        self._assert_same_as_loop(ALLOWED_PATHS, "/", True)
+        self._assert_same_as_loop(ALLOWED_PATHS, "/openapi.json", True)
+        self._assert_same_as_loop(ALLOWED_PATHS, "/docsx", False)
+        self._assert_same_as_loop(ALLOWED_PATHS, "/openapiXjson", False)
+
+    def test_given_wildcard_entry_when_is_allowed_path_then_match_prefix(self):
+        self._assert_same_as_loop(ALLOWED_PATHS, "/api/v1/auth/", True)
+        self._assert_same_as_loop(ALLOWED_PATHS, "/api/v1/auth/login", True)
+        self._assert_same_as_loop(ALLOWED_PATHS, "/api/v1/postlogin/renew-token", True)
+        self._assert_same_as_loop(ALLOWED_PATHS, "/api/v1/auth", False)
+        self._assert_same_as_loop(ALLOWED_PATHS, "/api/v1/users", False)
+
+    def test_given_trailing_slash_when_is_allowed_path_then_not_match_exact_entry(self):
+        self._assert_same_as_loop(ALLOWED_PATHS, "/docs/", False)
+
+    def test_given_empty_list_when_is_allowed_path_then_match_nothing(self):
+        self._assert_same_as_loop([], "/", False)
+        self._assert_same_as_loop([], "", False)
+        self._assert_same_as_loop([], "/docs", False)
@@ -0,0 +1,16 @@
+# shared helpers for tests that run RedisService against fake redis
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fakeredis import FakeAsyncRedis
+
+from app.service.redis_service import RedisService
+
+
+async def connect_fake_redis(service: RedisService) -> FakeAsyncRedis:
+    """Connect the service to an in-memory fake redis instead of a real pool"""
+    fake_redis = FakeAsyncRedis(decode_responses=True)
+    pool = MagicMock(disconnect=AsyncMock())
+    with patch("app.service.redis_service.BlockingConnectionPool.from_url", return_value=pool), \
+            patch("app.service.redis_service.Redis", return_value=fake_redis):
+        await service.connect()
+    return fake_redis
@@ -0,0 +1,125 @@
+# python unittest for postlogin_service layer with fake redis and mocked token verification
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from fastapi import HTTPException
+
+from app.schema.postlogin_dto import BasicCustomerInfo
+from app.service.postlogin_service import PostloginService
+from app.service.redis_service import RedisService
+from test.redis_helper import connect_fake_redis
+
+
+# region helpers
+
+def _get_basic_customer_info():
+    return BasicCustomerInfo(customer_id="CUST123", customer_name="John Doe", customer_type="SME")
+
+
+# endregion
+
+
+class TestPostloginService(unittest.IsolatedAsyncioTestCase):
+    """
+    Test PostloginService with a fake redis backend
+    """
+
+    async def asyncSetUp(self):
+        self.redis_service = RedisService()
+        self.fake_redis = await connect_fake_redis(self.redis_service)
+        self.verify_token = AsyncMock(return_value=True)
+
+        self._patches = [
+            patch("app.service.postlogin_service.redis_service", self.redis_service),
+            patch("app.service.postlogin_service.token_verification_service.verify_token", self.verify_token),
+        ]
+        for p in self._patches:
+            p.start()
+
+        self.service = PostloginService()
+
+    async def asyncTearDown(self):
+        for p in self._patches:
+            p.stop()
+        await self.redis_service.disconnect()
+
+    async def _init_session(self):
+        return await self.service.init_postlogin_user_session(
+            cif="1234567890",
+            basic_customer_info=_get_basic_customer_info(),
+            token_key="valid_token_key_123",
+            payload={"channelId": "sme"},
+            request_id_header="test-request-123"
+        )
+
+    async def test_given_initialized_session_when_renew_then_return_new_tokens(self):
+        # given
+        init_result = await self._init_session()
+
+        # when
+        result = await self.service.renew_postlogin_user_token(init_result["refreshToken"])
+
+        # then
+        self.assertEqual(result["message"], "SME token renewed successfully")
+        self.assertTrue(result["token"])
+        self.verify_token.assert_awaited_once_with("SME", "valid_token_key_123", "1234567890", "test-request-123")
+        session = await self.redis_service.get_json(b"session:VPB-SME-1234567890")
+        self.assertEqual(session["token_key"], "valid_token_key_123")
+        self.assertGreaterEqual(session["updated_at"], session["created_at"])
+
+    async def test_given_batched_write_fails_when_init_session_then_no_tokens_returned(self):
+        # given
+        setex_batched = AsyncMock(return_value=False)
+
+        # when
+        with patch.object(self.redis_service, "setex_batched", setex_batched), \
+                self.assertRaises(HTTPException) as ctx:
+            await self._init_session()
+
+        # then
+        self.assertEqual(ctx.exception.status_code, 500)
+        setex_batched.assert_awaited_once()
+        self.assertIsNone(await self.redis_service.get(b"session:VPB-SME-1234567890"))
+
+    async def test_given_cached_verification_when_verify_again_then_skip_external_call(self):
+        # given
+        await self.service._verify_token_cached("SME", "token", "1234567890", "rid")
+
+        # when
+        result = await self.service._verify_token_cached("SME", "token", "1234567890", "rid")
+
+        # then
+        self.assertTrue(result)
+        self.verify_token.assert_awaited_once()
+
+    async def test_given_concurrent_misses_when_verify_then_share_one_external_call(self):
+        # given
+        async def slow_verify(*_):
+            await asyncio.sleep(0.01)
+            return True
+
+        self.verify_token.side_effect = slow_verify
+
+        # when
+        results = await asyncio.gather(
+            *(self.service._verify_token_cached("SME", "token", "1234567890", "rid") for _ in range(5))
+        )
+
+        # then
+        self.assertEqual(results, [True] * 5)
+        self.verify_token.assert_awaited_once()
+        self.assertEqual(self.service._verify_locks, {})
+
+    async def test_given_failed_verification_when_verify_again_then_call_external_again(self):
+        # given
+        self.verify_token.return_value = False
+        await self.service._verify_token_cached("SME", "token", "1234567890", "rid")
+
+        # when
+        result = await self.service._verify_token_cached("SME", "token", "1234567890", "rid")
+
+        # then
+        self.assertFalse(result)
+        self.assertEqual(self.verify_token.await_count, 2)
+        self.assertEqual(self.service._verify_locks, {})
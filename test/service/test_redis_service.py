@@ -0,0 +1,71 @@
+# python unittest for redis_service batched session writes with fake redis
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.service.redis_service import RedisService
+from test.redis_helper import connect_fake_redis
+
+
+class TestRedisServiceBatchedWrites(unittest.IsolatedAsyncioTestCase):
+    """
+    Test RedisService.setex_batched with a fake redis backend
+    """
+
+    async def asyncSetUp(self):
+        self.service = RedisService()
+        self.fake_redis = await connect_fake_redis(self.service)
+
+    async def asyncTearDown(self):
+        await self.service.disconnect()
+
+    async def test_given_concurrent_writes_when_setex_batched_then_flush_in_one_pipeline(self):
+        # given
+        pipeline = MagicMock(wraps=self.service.pipeline)
+
+        # when
+        with patch.object(self.service, "pipeline", pipeline):
+            results = await asyncio.gather(
+                *(self.service.setex_batched(f"session:{i}", 60, f"value-{i}") for i in range(3))
+            )
+
+        # then
+        self.assertEqual(results, [True, True, True])
+        pipeline.assert_called_once()
+        for i in range(3):
+            self.assertEqual(await self.fake_redis.get(f"session:{i}"), f"value-{i}")
+            self.assertGreater(await self.fake_redis.ttl(f"session:{i}"), 0)
+
+    async def test_given_invalid_command_in_batch_when_setex_batched_then_only_that_write_fails(self):
+        # given an invalid expire time for the second write
+
+        # when
+        results = await asyncio.gather(
+            self.service.setex_batched("session:ok", 60, "value"),
+            self.service.setex_batched("session:bad", 0, "value"),
+        )
+
+        # then
+        self.assertEqual(results, [True, False])
+        self.assertEqual(await self.fake_redis.get("session:ok"), "value")
+        self.assertIsNone(await self.fake_redis.get("session:bad"))
+
+
+class TestRedisServiceBatchedWritesShutdown(unittest.IsolatedAsyncioTestCase):
+    """
+    Test RedisService.disconnect while batched writes are pending
+    """
+
+    async def test_given_write_in_batch_window_when_disconnect_then_write_resolves_false(self):
+        # given a long batch window so disconnect happens while the write is taken off the queue
+        service = RedisService()
+        with patch("app.service.redis_service.redis_settings.REDIS_WRITE_BATCH_WINDOW_MS", 10_000):
+            await connect_fake_redis(service)
+            write = asyncio.create_task(service.setex_batched("session:pending", 60, "value"))
+            await asyncio.sleep(0.01)
+
+            # when
+            await service.disconnect()
+
+        # then
+        self.assertFalse(await asyncio.wait_for(write, timeout=1))
@@ -0,0 +1,89 @@
+# python unittest for token_verification_service with a mocked HTTP transport
+import os
+import unittest
+from unittest.mock import patch
+
+import httpx
+from fastapi import HTTPException
+
+from app.service.token_verification_service import TokenVerificationService
+
+
+# region helpers
+
+def _get_payload():
+    return {"userId": "1234567890", "requestId": "test-request-123", "tokenKey": "valid_token_123"}
+
+
+# endregion
+
+
+class TestTokenVerificationService(unittest.IsolatedAsyncioTestCase):
+    """
+    Test TokenVerificationService.verify_sme_token through the shared HTTP client
+    """
+
+    async def asyncSetUp(self):
+        with patch.dict(os.environ, {"SME_VERIFY_BASE_URL": "http://sme.test/", "SME_VERIFY_TOKEN_KEY": "api-key"}):
+            self.service = TokenVerificationService()
+        self.requests = []
+
+    async def asyncTearDown(self):
+        await self.service.disconnect()
+
+    def _use_transport(self, is_expire: bool):
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return httpx.Response(200, json={"status": "success", "data": {"isExpire": is_expire}})
+
+        self.service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def test_given_shared_client_when_verify_twice_then_reuse_it(self):
+        # given
+        self._use_transport(is_expire=False)
+        client = self.service._client
+
+        # when
+        results = [await self.service.verify_sme_token(_get_payload()) for _ in range(2)]
+
+        # then
+        self.assertEqual(results, [{"isValid": True, "message": None}] * 2)
+        self.assertIs(self.service._client, client)
+        self.assertEqual(len(self.requests), 2)
+        request = self.requests[0]
+        self.assertEqual(str(request.url),
+                         "http://sme.test/corporate/relationship-management/marketing/v1/customer/validate-session")
+        self.assertEqual(request.headers["Apikey"], "api-key")
+        self.assertEqual(request.headers["x-request-id"], "test-request-123")
+        self.assertEqual(request.headers["x-session-token"], "valid_token_123")
+        self.assertEqual(request.headers["x-user-id"], "1234567890")
+
+    async def test_given_expired_session_when_verify_then_invalid(self):
+        # given
+        self._use_transport(is_expire=True)
+
+        # when
+        result = await self.service.verify_sme_token(_get_payload())
+
+        # then
+        self.assertFalse(result["isValid"])
+
+    async def test_given_connect_when_disconnect_then_client_closed(self):
+        # given
+        await self.service.connect()
+        client = self.service._client
+
+        # when
+        await self.service.disconnect()
+
+        # then
+        self.assertTrue(client.is_closed)
+        self.assertIsNone(self.service._client)
+
+    async def test_given_not_connected_when_verify_then_raise_server_error(self):
+        # when
+        with self.assertRaises(HTTPException) as ctx:
+            await self.service.verify_sme_token(_get_payload())
+
+        # then
+        self.assertEqual(ctx.exception.status_code, 500)
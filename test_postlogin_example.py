@@ -3,146 +3,206 @@
 Example script to test the postlogin functionality
 """
 import asyncio
-import json
+import sys
+from typing import Dict, Final, List, NamedTuple, Optional, Tuple
+
 import httpx
+import orjson
 
 
 BASE_URL = "http://localhost:8000/api/v1"
 
+# Paths relative to the client's base_url
+INIT_URL: Final = "/postlogin/init-session"
+RENEW_URL: Final = "/postlogin/renew-token"
+VALIDATE_URL: Final = "/corporate/relationship-management/marketing/v1/customer/validate-session"
+HEALTH_URL: Final = "/postlogin/health"
 
-async def test_postlogin_flow():
-    """Test the complete postlogin flow"""
+INIT_PAYLOAD: Final[dict] = {
+    "data": {
+        "cif": "1234567890",
+        "basicCustomerInfo": {
+            "customer_id": "CUST123",
+            "customer_name": "John Doe",
+            "customer_type": "SME"
+        },
+        "tokenKey": "valid_token_key_123",
+        "payload": {
+            "channelId": "sme"
+        }
+    }
+}
+
+# Static request bodies are serialized once at import time
+INIT_BODY: Final[bytes] = orjson.dumps(INIT_PAYLOAD)
+EMPTY_BODY: Final[bytes] = b"{}"
+
+JSON_HEADERS: Final = {
+    "Content-Type": "application/json",
+    "x-request-id": "test-request-123"
+}
+
+RENEW_HEADERS: Final = {"Content-Type": "application/json"}
+
+MOCK_HEADERS: Final = {
+    "Apikey": "test-api-key",
+    "Content-Type": "application/json",
+    "x-request-id": "test-request-456",
+    "x-session-token": "valid_token_123",
+    "x-user-id": "1234567890"
+}
+
+
+def _write_error(line: str):
+    """Write a failure to stderr right away instead of buffering it with the report"""
+    sys.stderr.write(f"❌ {line}\n")
+    sys.stderr.flush()
+
+
+def _write_status_error(error: httpx.HTTPStatusError):
+    """Report a failed response, the error already carries request and response"""
+    _write_error(f"{error.request.url} → {error.response.status_code}: {error.response.text}")
+
+
+async def init_and_renew(client: httpx.AsyncClient) -> List[str]:
+    """Test 1 and 2: initialize a session, then renew its token"""
+    out = ["\n1. Testing session initialization..."]
     
-    async with httpx.AsyncClient() as client:
-        print("🚀 Testing Postlogin API Flow")
-        print("=" * 50)
+    try:
+        response = await client.post(
+            INIT_URL,
+            content=INIT_BODY,
+            headers=JSON_HEADERS
+        )
+        response.raise_for_status()
         
-        # Test 1: Initialize postlogin session
-        print("\n1. Testing session initialization...")
+        out.append("✅ Session initialization successful!")
+        result = orjson.loads(response.content)
+        out.append(f"   Token: {result['token'][:50]}...")
+        out.append(f"   Refresh Token: {result['refreshToken'][:50]}...")
+        out.append(f"   Message: {result['message']}")
         
-        init_payload = {
-            "data": {
-                "cif": "1234567890",
-                "basicCustomerInfo": {
-                    "customer_id": "CUST123",
-                    "customer_name": "John Doe",
-                    "customer_type": "SME"
-                },
-                "tokenKey": "valid_token_key_123",
-                "payload": {
-                    "channelId": "sme"
-                }
-            }
-        }
+        refresh_token = result['refreshToken']
         
-        headers = {
-            "Content-Type": "application/json",
-            "x-request-id": "test-request-123"
-        }
+        # Test 2: Renew token
+        out.append("\n2. Testing token renewal...")
         
-        try:
-            response = await client.post(
-                f"{BASE_URL}/postlogin/init-session",
-                json=init_payload,
-                headers=headers
-            )
-            
-            if response.status_code == 200:
-                print("✅ Session initialization successful!")
-                result = response.json()
-                print(f"   Token: {result['token'][:50]}...")
-                print(f"   Refresh Token: {result['refreshToken'][:50]}...")
-                print(f"   Message: {result['message']}")
-                
-                refresh_token = result['refreshToken']
-                
-                # Test 2: Renew token
-                print("\n2. Testing token renewal...")
-                
-                renew_payload = {
-                    "data": {
-                        "refreshToken": refresh_token
-                    }
-                }
-                
-                renew_response = await client.post(
-                    f"{BASE_URL}/postlogin/renew-token",
-                    json=renew_payload,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                if renew_response.status_code == 200:
-                    print("✅ Token renewal successful!")
-                    renew_result = renew_response.json()
-                    print(f"   New Token: {renew_result['token'][:50]}...")
-                    print(f"   New Refresh Token: {renew_result['refreshToken'][:50]}...")
-                    print(f"   Message: {renew_result['message']}")
-                else:
-                    print(f"❌ Token renewal failed: {renew_response.status_code}")
-                    print(f"   Response: {renew_response.text}")
-                    
-            else:
-                print(f"❌ Session initialization failed: {response.status_code}")
-                print(f"   Response: {response.text}")
-                
-        except Exception as e:
-            print(f"❌ Error during testing: {e}")
+        renew_response = await client.post(
+            RENEW_URL,
+            content=orjson.dumps({"data": {"refreshToken": refresh_token}}),
+            headers=RENEW_HEADERS
+        )
+        renew_response.raise_for_status()
         
-        # Test 3: Test mock validation API
-        print("\n3. Testing mock validation API...")
+        out.append("✅ Token renewal successful!")
+        renew_result = orjson.loads(renew_response.content)
+        out.append(f"   New Token: {renew_result['token'][:50]}...")
+        out.append(f"   New Refresh Token: {renew_result['refreshToken'][:50]}...")
+        out.append(f"   Message: {renew_result['message']}")
         
-        try:
-            mock_headers = {
-                "Apikey": "test-api-key",
-                "x-request-id": "test-request-456",
-                "x-session-token": "valid_token_123",
-                "x-user-id": "1234567890"
-            }
-            
-            mock_response = await client.post(
-                f"{BASE_URL}/corporate/relationship-management/marketing/v1/customer/validate-session",
-                json={},
-                headers=mock_headers
-            )
-            
-            if mock_response.status_code == 200:
-                print("✅ Mock validation API successful!")
-                mock_result = mock_response.json()
-                print(f"   Status: {mock_result['status']}")
-                print(f"   Is Expired: {mock_result['data']['isExpire']}")
-                print(f"   Message: {mock_result['message']}")
-            else:
-                print(f"❌ Mock validation API failed: {mock_response.status_code}")
-                print(f"   Response: {mock_response.text}")
-                
-        except Exception as e:
-            print(f"❌ Error during mock API testing: {e}")
+    except httpx.HTTPStatusError as e:
+        _write_status_error(e)
+    except Exception as e:
+        _write_error(f"Error during testing: {e}")
+    
+    return out
+
+
+class Check(NamedTuple):
+    """Independent request/response check run by _run_check"""
+    title: str
+    label: str
+    method: str
+    url: str
+    headers: Dict[str, str]
+    body: Optional[bytes]
+    # (caption, path into the JSON response) pairs printed on success
+    fields: Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+
+CHECKS: Final[List[Check]] = [
+    Check("3. Testing mock validation API...", "Mock validation API", "POST", VALIDATE_URL, MOCK_HEADERS, EMPTY_BODY,
+          (("Status", ("status",)), ("Is Expired", ("data", "isExpire")), ("Message", ("message",)))),
+    Check("4. Testing health check...", "Health check", "GET", HEALTH_URL, {}, None,
+          (("Status", ("status",)), ("Service", ("service",)))),
+]
+
+
+async def _run_check(client: httpx.AsyncClient, check: Check) -> List[str]:
+    """Send the request of a check and format its result"""
+    out = [f"\n{check.title}"]
+    
+    try:
+        response = await client.request(check.method, check.url, content=check.body, headers=check.headers)
+        response.raise_for_status()
         
-        # Test 4: Health check
-        print("\n4. Testing health check...")
+        out.append(f"✅ {check.label} successful!")
+        result = orjson.loads(response.content)
+        for caption, path in check.fields:
+            value = result
+            for key in path:
+                value = value[key]
+            out.append(f"   {caption}: {value}")
+        
+    except httpx.HTTPStatusError as e:
+        _write_status_error(e)
+    except Exception as e:
+        _write_error(f"Error during {check.label}: {e}")
+    
+    return out
+
+
+async def test_postlogin_flow():
+    """Test the complete postlogin flow"""
+    
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=httpx.Timeout(10.0, connect=2.0),
+        http2=True
+    ) as client:
+        sys.stdout.write("🚀 Testing Postlogin API Flow\n" + "=" * 50 + "\n")
         
+        # Open one connection up front so the concurrent requests below can reuse it (multiplexed over
+        # HTTP/2 on https hosts) instead of each opening its own. The status is irrelevant.
         try:
-            health_response = await client.get(f"{BASE_URL}/postlogin/health")
-            
-            if health_response.status_code == 200:
-                print("✅ Health check successful!")
-                health_result = health_response.json()
-                print(f"   Status: {health_result['status']}")
-                print(f"   Service: {health_result['service']}")
-            else:
-                print(f"❌ Health check failed: {health_response.status_code}")
-                
-        except Exception as e:
-            print(f"❌ Error during health check: {e}")
+            await client.head(HEALTH_URL)
+        except httpx.HTTPError:
+            pass
         
-        print("\n" + "=" * 50)
-        print("🎉 Postlogin API testing completed!")
+        # Renewal depends on init, the other checks are independent and run concurrently
+        results = await asyncio.gather(
+            init_and_renew(client), *(_run_check(client, check) for check in CHECKS),
+            return_exceptions=True
+        )
+        
+        # Buffer the report and emit it with a single write, errors were already written to stderr
+        out: List[str] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                # Only exceptions not derived from Exception get past the handlers in the coroutines
+                _write_error(f"Error during testing: {result!r}")
+                continue
+            out.extend(result)
+        
+        out.append("\n" + "=" * 50)
+        out.append("🎉 Postlogin API testing completed!")
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
     print("Make sure the FastAPI server is running on http://localhost:8000")
     print("You can start it with: uvicorn app.main:app --reload")
-    print("\nPress Enter to continue...")
-    input()
+    
+    # Only prompt for interactive runs, CI (no TTY) or -y / --yes start right away
+    if sys.stdin.isatty() and not {"-y", "--yes"} & set(sys.argv[1:]):
+        print("\nPress Enter to continue...")
+        input()
+    
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     
     asyncio.run(test_postlogin_flow())